@@ -1,10 +1,20 @@
 import base64
+import hashlib
+import json
 import logging
 import os
 
 import ee
 import pytest
 
+import openet.ssebop.utils as utils
+
+# The tests make many small independent requests, which is the workload the
+#   high volume endpoint is intended for
+# The URL is passed positionally since the keyword was "opt_url" in older
+#   earthengine-api versions and is "url" in newer ones
+EE_URL = 'https://earthengine-highvolume.googleapis.com'
+
 
 @pytest.fixture(scope="session", autouse=True)
 def test_init():
@@ -13,12 +23,105 @@ def test_init():
     logging.debug('Test Setup')
 
     # For GitHub Actions authenticate using private key environment variable
+    # The key is passed directly instead of being written to privatekey.json
+    #   since each pytest-xdist worker runs this fixture in a separate process
     if 'EE_PRIVATE_KEY_B64' in os.environ:
-        print('Writing privatekey.json from environmental variable ...')
         content = base64.b64decode(os.environ['EE_PRIVATE_KEY_B64']).decode('ascii')
-        EE_KEY_FILE = 'privatekey.json'
-        with open(EE_KEY_FILE, 'w') as f:
-            f.write(content)
-        ee.Initialize(ee.ServiceAccountCredentials('', key_file=EE_KEY_FILE))
+        ee.Initialize(ee.ServiceAccountCredentials('', key_data=content), EE_URL)
     else:
-        ee.Initialize()
+        ee.Initialize('persistent', EE_URL)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ee_warmup(test_init):
+    """Make an initial request for the Landsat scene used by the default test image
+
+    The first request pays the connection and asset lookup startup costs, so
+    this keeps that time from being attributed to whichever test runs first.
+    """
+    utils.getinfo_raise(ee.List([
+        ee.Number(1),
+        ee.Image('LANDSAT/LC08/C02/T1_L2/LC08_042035_20150713').bandNames(),
+    ]))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--no-ee-cache', action='store_true', default=False,
+        help='Recompute the point image values instead of reading them from the cache')
+
+
+def ee_cache_key(image, xy, scale, properties=None):
+    """Build the cache key from the serialized image computation and the point"""
+    key = hashlib.sha1(json.dumps(
+        [ee.Image(image).serialize(), list(xy), scale, properties]).encode()).hexdigest()
+    return f'ee/{key}'
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ee_cache(request, test_init):
+    """Cache the point image values in the pytest cache across test runs
+
+    The values are cached for each image/point pair, and the cache key is built
+    from the serialized image computation, so any change to the model code or
+    the test inputs will result in a new request.  With --no-ee-cache the
+    cached values are not read, but the recomputed values are still written.
+    """
+    # The cache is not available if the cacheprovider plugin is disabled
+    cache = getattr(request.config, 'cache', None)
+    state = {
+        'enabled': cache is not None,
+        'read': not request.config.getoption('--no-ee-cache'),
+    }
+    point_image_value = utils.point_image_value
+    point_image_values = utils.point_image_values
+
+    def cached_point_image_values(image_xy_list, scale=1):
+        if not state['enabled']:
+            return point_image_values(image_xy_list, scale)
+
+        keys = [ee_cache_key(image, xy, scale) for image, xy in image_xy_list]
+        if state['read']:
+            output = [cache.get(key, None) for key in keys]
+        else:
+            output = [None] * len(keys)
+
+        # Only the pairs that are not in the cache are requested
+        missing = [i for i, value in enumerate(output) if value is None]
+        if missing:
+            values = point_image_values([image_xy_list[i] for i in missing], scale)
+            for i, value in zip(missing, values):
+                cache.set(keys[i], value)
+                output[i] = value
+
+        return output
+
+    def cached_point_image_value(image, xy, scale=1, properties=None):
+        if not state['enabled']:
+            return point_image_value(image, xy, scale, properties)
+
+        key = ee_cache_key(image, xy, scale, properties)
+        output = cache.get(key, None) if state['read'] else None
+        if output is None:
+            output = point_image_value(image, xy, scale, properties)
+            if output is not None:
+                cache.set(key, output)
+        return output
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(utils, 'point_image_value', cached_point_image_value)
+        mp.setattr(utils, 'point_image_values', cached_point_image_values)
+        yield state
+
+
+@pytest.fixture(autouse=True)
+def ee_cache_marker(request, ee_cache):
+    """Skip the point image value cache for tests marked with no_ee_cache"""
+    if request.node.get_closest_marker('no_ee_cache') is None:
+        yield
+        return
+
+    enabled = ee_cache['enabled']
+    ee_cache['enabled'] = False
+    yield
+    ee_cache['enabled'] = enabled
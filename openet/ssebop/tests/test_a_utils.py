@@ -5,6 +5,9 @@ import pytest
 
 import openet.ssebop.utils as utils
 
+# The utils functions are tested directly instead of through the point value cache
+pytestmark = pytest.mark.no_ee_cache
+
 
 def test_getinfo():
     assert utils.getinfo(ee.Number(1)) == 1
@@ -15,6 +18,15 @@ def test_getinfo_exception():
         utils.getinfo('deadbeef')
 
 
+def test_getinfo_raise():
+    assert utils.getinfo_raise(ee.Number(1)) == 1
+
+
+def test_getinfo_raise_eeexception():
+    with pytest.raises(ee.ee_exception.EEException):
+        utils.getinfo_raise(ee.Image('DEADBEEF').bandNames(), n=2)
+
+
 # # CGM - Not sure how to trigger an EEException to test that the output is None
 # #   This fails before it is sent to the getinfo function
 # def test_getinfo_eeexception():
@@ -26,6 +38,12 @@ def test_constant_image_value(expected=10.123456789, tol=0.000001):
     assert abs(output['constant'] - expected) <= tol
 
 
+def test_constant_image_values(tol=0.000001):
+    output = utils.constant_image_values([ee.Image.constant(1.5), ee.Image.constant(2.5)])
+    assert abs(output[0]['constant'] - 1.5) <= tol
+    assert abs(output[1]['constant'] - 2.5) <= tol
+
+
 @pytest.mark.parametrize(
     'image_id, xy, scale, expected, tol',
     [
@@ -42,6 +60,23 @@ def test_point_image_value(image_id, xy, scale, expected, tol):
     assert abs(output['output'] - expected) <= tol
 
 
+def test_point_image_value_properties(xy=[-106.03249, 37.17777]):
+    output = utils.point_image_value(
+        ee.Image('USGS/3DEP/10m').select(['elevation'], ['output']).set({'foo': 'bar'}),
+        xy, scale=30, properties=['foo'])
+    assert abs(output['output'] - 2364.169) <= 0.001
+    assert output['foo'] == 'bar'
+
+
+def test_point_image_values(xy=[-106.03249, 37.17777], tol=0.001):
+    output = utils.point_image_values([
+        [ee.Image('USGS/3DEP/10m').select(['elevation'], ['output']), xy],
+        [ee.Image('NASA/NASADEM_HGT/001').select(['elevation'], ['output']), xy],
+    ], scale=30)
+    assert abs(output[0]['output'] - 2364.169) <= tol
+    assert abs(output[1]['output'] - 2361) <= tol
+
+
 @pytest.mark.parametrize(
     'image_id, image_date, xy, scale, expected, tol',
     [
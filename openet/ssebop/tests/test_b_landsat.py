@@ -1,5 +1,6 @@
 # import datetime
 # import pprint
+import functools
 
 import ee
 import pytest
@@ -10,8 +11,7 @@ import openet.ssebop.utils as utils
 # import openet.core.utils as utils
 
 
-# Should these be test fixtures instead?
-# I'm not sure how to make them fixtures and allow input parameters
+@functools.lru_cache(typed=True)
 def toa_image(red=0.1, nir=0.9, bt=305):
     """Construct a fake Landsat 8 TOA image with renamed bands"""
     return (
@@ -25,6 +25,7 @@ def toa_image(red=0.1, nir=0.9, bt=305):
     )
 
 
+@functools.lru_cache(typed=True)
 def sr_image(red=1000, nir=9000, bt=305):
     """Construct a fake Landsat 8 TOA image with renamed bands"""
     return (
@@ -38,55 +39,81 @@ def sr_image(red=1000, nir=9000, bt=305):
     )
 
 
-@pytest.mark.parametrize(
-    'red, nir, expected',
-    [
-        [0.2, 9.0 / 55, -0.1],
-        [0.2, 0.2,  0.0],
-        [0.1, 11.0 / 90,  0.1],
-        [0.2, 0.3, 0.2],
-        [0.1, 13.0 / 70, 0.3],
-        [0.3, 0.7, 0.4],
-        [0.2, 0.6, 0.5],
-        [0.2, 0.8, 0.6],
-        [0.1, 17.0 / 30, 0.7],
-        [0.1, 0.9, 0.8],
-    ]
-)
-def test_ndvi_calculation(red, nir, expected, tol=0.000001):
-    toa = toa_image(red=red, nir=nir)
-    output = utils.constant_image_value(landsat.ndvi(toa))
-    assert abs(output['ndvi'] - expected) <= tol
+def toa_case_values(func, cases):
+    """Compute a TOA image function for all of the test cases in a single call"""
+    return dict(zip(cases, utils.constant_image_values([
+        func(toa_image(red=red, nir=nir)) for red, nir, expected in cases.values()
+    ])))
 
 
-def test_ndvi_band_name():
-    output = utils.getinfo(landsat.ndvi(toa_image()))
-    assert output['bands'][0]['id'] == 'ndvi'
+NDVI_CASES = {
+    '-0.1': [0.2, 9.0 / 55, -0.1],
+    '0.0': [0.2, 0.2,  0.0],
+    '0.1': [0.1, 11.0 / 90,  0.1],
+    '0.2': [0.2, 0.3, 0.2],
+    '0.3': [0.1, 13.0 / 70, 0.3],
+    '0.4': [0.3, 0.7, 0.4],
+    '0.5': [0.2, 0.6, 0.5],
+    '0.6': [0.2, 0.8, 0.6],
+    '0.7': [0.1, 17.0 / 30, 0.7],
+    '0.8': [0.1, 0.9, 0.8],
+}
 
 
-@pytest.mark.parametrize(
-    'red, nir, expected',
-    [
-        [0.2, 9.0 / 55, 0.985],      # -0.1
-        [0.2, 0.2,  0.977],          # 0.0
-        [0.1, 11.0 / 90,  0.977],    # 0.1
-        [0.2, 0.2999, 0.977],        # 0.3- (0.3 NIR isn't exactly an NDVI of 0.2)
-        [0.2, 0.3001, 0.986335],     # 0.3+
-        [0.1, 13.0 / 70, 0.986742],  # 0.3
-        [0.3, 0.7, 0.987964],        # 0.4
-        [0.2, 0.6, 0.99],            # 0.5
-        [0.2, 0.8, 0.99],            # 0.6
-        [0.1, 17.0 / 30, 0.99],      # 0.7
-    ]
-)
-def test_emissivity_calculation(red, nir, expected, tol=0.000001):
-    output = utils.constant_image_value(landsat.emissivity(toa_image(red=red, nir=nir)))
-    assert abs(output['emissivity'] - expected) <= tol
+@pytest.fixture(scope='module')
+def ndvi_values():
+    return toa_case_values(landsat.ndvi, NDVI_CASES)
+
+
+@pytest.mark.xdist_group(name='ndvi_values')
+@pytest.mark.parametrize('case_id', NDVI_CASES)
+def test_ndvi_calculation(ndvi_values, case_id, tol=0.000001):
+    assert abs(ndvi_values[case_id]['ndvi'] - NDVI_CASES[case_id][-1]) <= tol
+
+
+@pytest.fixture(scope='module')
+def band_names():
+    return utils.getinfo_raise(ee.Dictionary({
+        'ndvi': landsat.ndvi(toa_image()).bandNames().get(0),
+        'emissivity': landsat.emissivity(toa_image()).bandNames().get(0),
+        'lst': landsat.lst(toa_image()).bandNames().get(0),
+    }))
+
+
+@pytest.mark.xdist_group(name='landsat_band_names')
+def test_ndvi_band_name(band_names):
+    assert band_names['ndvi'] == 'ndvi'
+
+
+# The case IDs are the approximate NDVI of the test case
+EMISSIVITY_CASES = {
+    '-0.1': [0.2, 9.0 / 55, 0.985],
+    '0.0': [0.2, 0.2,  0.977],
+    '0.1': [0.1, 11.0 / 90,  0.977],
+    '0.3-': [0.2, 0.2999, 0.977],  # 0.3 NIR isn't exactly an NDVI of 0.2
+    '0.3+': [0.2, 0.3001, 0.986335],
+    '0.3': [0.1, 13.0 / 70, 0.986742],
+    '0.4': [0.3, 0.7, 0.987964],
+    '0.5': [0.2, 0.6, 0.99],
+    '0.6': [0.2, 0.8, 0.99],
+    '0.7': [0.1, 17.0 / 30, 0.99],
+}
+
+
+@pytest.fixture(scope='module')
+def emissivity_values():
+    return toa_case_values(landsat.emissivity, EMISSIVITY_CASES)
+
+
+@pytest.mark.xdist_group(name='emissivity_values')
+@pytest.mark.parametrize('case_id', EMISSIVITY_CASES)
+def test_emissivity_calculation(emissivity_values, case_id, tol=0.000001):
+    assert abs(emissivity_values[case_id]['emissivity'] - EMISSIVITY_CASES[case_id][-1]) <= tol
 
 
-def test_emissivity_band_name():
-    output = utils.getinfo(landsat.emissivity(toa_image()))
-    assert output['bands'][0]['id'] == 'emissivity'
+@pytest.mark.xdist_group(name='landsat_band_names')
+def test_emissivity_band_name(band_names):
+    assert band_names['emissivity'] == 'emissivity'
 
 
 @pytest.mark.parametrize(
@@ -100,6 +127,6 @@ def test_lst_calculation(red, nir, bt, expected, tol=0.000001):
     assert abs(output['lst'] - expected) <= tol
 
 
-def test_lst_band_name():
-    output = utils.getinfo(landsat.lst(toa_image()))
-    assert output['bands'][0]['id'] == 'lst'
+@pytest.mark.xdist_group(name='landsat_band_names')
+def test_lst_band_name(band_names):
+    assert band_names['lst'] == 'lst'
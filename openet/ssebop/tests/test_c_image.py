@@ -1,4 +1,5 @@
 import datetime
+import functools
 # import pprint
 
 import ee
@@ -47,10 +48,13 @@ TEST_POINT = (-119.44252382373145, 36.04047742246546)
 #     #     })
 
 
+# typed=True keeps integer and float parameters from sharing a cached image
+@functools.lru_cache(typed=True)
 def default_image(lst=305, ndvi=0.8, qa_water=0):
     # First construct a fake 'prepped' input image
+    # The single band mask image is added to all of the constant bands at once
     mask_img = ee.Image(f'{COLL_ID}/{SCENE_ID}').select(['SR_B3']).multiply(0)
-    return ee.Image([mask_img.add(lst), mask_img.add(ndvi), mask_img.add(qa_water)]) \
+    return mask_img.add(ee.Image.constant([lst, ndvi, qa_water])) \
         .rename(['lst', 'ndvi', 'qa_water']) \
         .set({
             'system:index': SCENE_ID,
@@ -145,6 +149,35 @@ def default_image_obj(
     ))
 
 
+def point_case_values(cases, image_func):
+    """Get the point values for all of the cases in a test case table in a single call
+
+    The image for each case is built by calling image_func with the case inputs,
+    the point is the second to last item, and the expected value is the last item.
+    """
+    return dict(zip(cases, utils.point_image_values([
+        [image_func(*case[:-2]), case[-2]] for case in cases.values()
+    ])))
+
+
+def case_properties(cases, image_func, properties):
+    """Get the image properties for all of the cases in a test case table in a single call"""
+    # Only the tested properties are requested instead of the full image info
+    return dict(zip(cases, utils.getinfo_raise(ee.List([
+        ee.Image(image_func(*case[:-2])).toDictionary(properties) for case in cases.values()
+    ]))))
+
+
+# The band names for all of the band name tests are requested in a single call
+@pytest.fixture(scope='module')
+def band_names():
+    m = default_image_obj()
+    return utils.getinfo_raise(ee.Dictionary({
+        'elev': ee.Image(m.elev).bandNames().get(0),
+        'tcorr_image': m.tcorr_image.bandNames().get(0),
+    }))
+
+
 def test_Image_init_default_parameters():
     m = ssebop.Image(default_image())
     assert m.et_reference_source is None
@@ -234,59 +267,106 @@ def test_Image_elev_source_exception(elev_source):
         utils.getinfo(default_image_obj(elev_source=elev_source).elev)
 
 
-@pytest.mark.parametrize(
-    'elev_source, xy, expected',
-    [
-        # Check string/float constant values
-        ['2364.351', [-106.03249, 37.17777], 2364.351],
-        [2364.351, [-106.03249, 37.17777], 2364.351],
-        # Check custom images
-        ['projects/usgs-ssebop/srtm_1km', [-106.03249, 37.17777], 2369.0],
-        ['projects/earthengine-legacy/assets/projects/usgs-ssebop/srtm_1km',
-         [-106.03249, 37.17777], 2369.0],
-        ['USGS/NED', [-106.03249, 37.17777], 2364.351],
-    ]
-)
-def test_Image_elev_source(elev_source, xy, expected, tol=0.001):
+# The source value test cases are keyed by the test case ID so that the values
+#   for all of the cases in a table can be requested with a single call
+ELEV_SOURCE_CASES = {
+    # Check custom images
+    'srtm_1km': ['projects/usgs-ssebop/srtm_1km', [-106.03249, 37.17777], 2369.0],
+    'srtm_1km_legacy': ['projects/earthengine-legacy/assets/projects/usgs-ssebop/srtm_1km',
+                        [-106.03249, 37.17777], 2369.0],
+    'ned': ['USGS/NED', [-106.03249, 37.17777], 2364.351],
+}
+
+
+def elev_image(elev_source):
+    return default_image_obj(elev_source=elev_source).elev
+
+
+@pytest.fixture(scope='module')
+def elev_source_values():
+    return point_case_values(ELEV_SOURCE_CASES, elev_image)
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name='elev_source_values')
+@pytest.mark.parametrize('case_id', ELEV_SOURCE_CASES)
+def test_Image_elev_source(elev_source_values, case_id, tol=0.001):
     """Test getting elevation values for a single date at a real point"""
-    output = utils.point_image_value(default_image_obj(
-        elev_source=elev_source).elev, xy)
-    assert abs(output['elev'] - expected) <= tol
+    expected = ELEV_SOURCE_CASES[case_id][-1]
+    assert abs(elev_source_values[case_id]['elev'] - expected) <= tol
 
 
-def test_Image_elev_band_name():
-    output = utils.getinfo(default_image_obj().elev)['bands'][0]['id']
-    assert output == 'elev'
+ELEV_CONSTANT_CASES = {
+    'constant_str': ['2364.351', [-106.03249, 37.17777], 2364.351],
+    'constant_float': [2364.351, [-106.03249, 37.17777], 2364.351],
+}
 
 
-@pytest.mark.parametrize(
-    'dt_source, doy, xy, expected',
-    [
-        ['projects/usgs-ssebop/dt/daymet_median_v6', SCENE_DOY, TEST_POINT, 20.77],
-        ['projects/earthengine-legacy/assets/projects/usgs-ssebop/dt/daymet_median_v6',
-         SCENE_DOY, TEST_POINT, 20.77],
-    ]
-)
-def test_Image_dt_source_values(dt_source, doy, xy, expected, tol=0.001):
-    """Test getting dT values for a single date at a real point"""
+@pytest.fixture(scope='module')
+def elev_constant_values():
+    return point_case_values(ELEV_CONSTANT_CASES, elev_image)
+
+
+@pytest.mark.xdist_group(name='elev_constant_values')
+@pytest.mark.parametrize('case_id', ELEV_CONSTANT_CASES)
+def test_Image_elev_source_constant(elev_constant_values, case_id, tol=0.001):
+    """Test getting constant elevation values at a real point"""
+    expected = ELEV_CONSTANT_CASES[case_id][-1]
+    assert abs(elev_constant_values[case_id]['elev'] - expected) <= tol
+
+
+@pytest.mark.xdist_group(name='image_band_names')
+def test_Image_elev_band_name(band_names):
+    assert band_names['elev'] == 'elev'
+
+
+DT_SOURCE_CASES = {
+    'daymet_median_v6': [
+        'projects/usgs-ssebop/dt/daymet_median_v6', SCENE_DOY, TEST_POINT, 20.77],
+    'daymet_median_v6_legacy': [
+        'projects/earthengine-legacy/assets/projects/usgs-ssebop/dt/daymet_median_v6',
+        SCENE_DOY, TEST_POINT, 20.77],
+}
+
+
+def dt_image(dt_source, doy=None):
     m = default_image_obj(dt_source=dt_source)
-    m._doy = doy
-    output = utils.point_image_value(ee.Image(m.dt), xy)
-    assert abs(output['dt'] - expected) <= tol
+    if doy is not None:
+        m._doy = doy
+    return m.dt
 
 
-@pytest.mark.parametrize(
-    'dt_source, xy, expected',
-    [
-        ['19.262', [-120.113, 36.336], 19.262],
-        [19.262, [-120.113, 36.336], 19.262],
-    ]
-)
-def test_Image_dt_source_constant(dt_source, xy, expected, tol=0.001):
+@pytest.fixture(scope='module')
+def dt_source_values():
+    return point_case_values(DT_SOURCE_CASES, dt_image)
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name='dt_source_values')
+@pytest.mark.parametrize('case_id', DT_SOURCE_CASES)
+def test_Image_dt_source_values(dt_source_values, case_id, tol=0.001):
+    """Test getting dT values for a single date at a real point"""
+    expected = DT_SOURCE_CASES[case_id][-1]
+    assert abs(dt_source_values[case_id]['dt'] - expected) <= tol
+
+
+DT_CONSTANT_CASES = {
+    'constant_str': ['19.262', [-120.113, 36.336], 19.262],
+    'constant_float': [19.262, [-120.113, 36.336], 19.262],
+}
+
+
+@pytest.fixture(scope='module')
+def dt_constant_values():
+    return point_case_values(DT_CONSTANT_CASES, dt_image)
+
+
+@pytest.mark.xdist_group(name='dt_constant_values')
+@pytest.mark.parametrize('case_id', DT_CONSTANT_CASES)
+def test_Image_dt_source_constant(dt_constant_values, case_id, tol=0.001):
     """Test getting constant dT values for a single date at a real point"""
-    m = default_image_obj(dt_source=dt_source)
-    output = utils.point_image_value(ee.Image(m.dt), xy)
-    assert abs(output['dt'] - expected) <= tol
+    expected = DT_CONSTANT_CASES[case_id][-1]
+    assert abs(dt_constant_values[case_id]['dt'] - expected) <= tol
 
 
 def test_Image_dt_source_exception():
@@ -294,6 +374,7 @@ def test_Image_dt_source_exception():
         utils.getinfo(default_image_obj(dt_source='').dt)
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize(
     'dt_source, doy, xy, expected',
     [
@@ -324,25 +405,52 @@ def test_Image_tmax_source(tmax_source):
     assert default_image_obj(tmax_source=tmax_source).tmax
 
 
-@pytest.mark.parametrize(
-    'tmax_source, xy, expected',
-    [
-        ['projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010', TEST_POINT, 310.0847],
-        ['projects/earthengine-legacy/assets/projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010',
-         TEST_POINT, 310.0847],
-        ['projects/usgs-ssebop/tmax/daymet_v3_median_1980_2018', TEST_POINT, 310.15],
-        ['projects/usgs-ssebop/tmax/daymet_v4_median_1980_2019', TEST_POINT, 310.155],
-        # ['projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010', TEST_POINT, 310.155],
-        # Check string/float constant values
-        ['305', [-120.113, 36.336], 305],
-        [305, [-120.113, 36.336], 305],
-    ]
-)
-def test_Image_tmax_source_values(tmax_source, xy, expected, tol=0.001):
+TMAX_SOURCE_CASES = {
+    'daymet_v4_mean_1981_2010': [
+        'projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010', TEST_POINT, 310.0847],
+    'daymet_v4_mean_1981_2010_legacy': [
+        'projects/earthengine-legacy/assets/projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010',
+        TEST_POINT, 310.0847],
+    'daymet_v3_median_1980_2018': [
+        'projects/usgs-ssebop/tmax/daymet_v3_median_1980_2018', TEST_POINT, 310.15],
+    'daymet_v4_median_1980_2019': [
+        'projects/usgs-ssebop/tmax/daymet_v4_median_1980_2019', TEST_POINT, 310.155],
+}
+TMAX_CONSTANT_CASES = {
+    'constant_str': ['305', [-120.113, 36.336], 305],
+    'constant_float': [305, [-120.113, 36.336], 305],
+}
+
+
+def tmax_image(tmax_source):
+    return default_image_obj(tmax_source=tmax_source).tmax
+
+
+@pytest.fixture(scope='module')
+def tmax_source_values():
+    return point_case_values(TMAX_SOURCE_CASES, tmax_image)
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name='tmax_source_values')
+@pytest.mark.parametrize('case_id', TMAX_SOURCE_CASES)
+def test_Image_tmax_source_values(tmax_source_values, case_id, tol=0.001):
     """Test getting Tmax values for a single date at a real point"""
-    m = default_image_obj(tmax_source=tmax_source)
-    output = utils.point_image_value(ee.Image(m.tmax), xy)
-    assert abs(output['tmax'] - expected) <= tol
+    expected = TMAX_SOURCE_CASES[case_id][-1]
+    assert abs(tmax_source_values[case_id]['tmax'] - expected) <= tol
+
+
+@pytest.fixture(scope='module')
+def tmax_constant_values():
+    return point_case_values(TMAX_CONSTANT_CASES, tmax_image)
+
+
+@pytest.mark.xdist_group(name='tmax_constant_values')
+@pytest.mark.parametrize('case_id', TMAX_CONSTANT_CASES)
+def test_Image_tmax_source_constant(tmax_constant_values, case_id, tol=0.001):
+    """Test getting constant Tmax values at a real point"""
+    expected = TMAX_CONSTANT_CASES[case_id][-1]
+    assert abs(tmax_constant_values[case_id]['tmax'] - expected) <= tol
 
 
 @pytest.mark.parametrize(
@@ -359,24 +467,30 @@ def test_Image_tmax_source_exception(tmax_source):
         utils.getinfo(default_image_obj(tmax_source=tmax_source).tmax)
 
 
-@pytest.mark.parametrize(
-    'tmax_source, expected',
-    [
-        ['projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010', {}],
-        ['projects/earthengine-legacy/assets/projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010', {}],
-        ['projects/usgs-ssebop/tmax/daymet_v3_median_1980_2018', {}],
-        ['projects/usgs-ssebop/tmax/daymet_v4_median_1980_2019', {}],
-        ['305', {'tmax_source': 'custom_305'}],
-        [305, {'tmax_source': 'custom_305'}],
-    ]
-)
-def test_Image_tmax_properties(tmax_source, expected):
+@pytest.fixture(scope='module')
+def tmax_properties():
+    return case_properties(TMAX_SOURCE_CASES, tmax_image, ['tmax_source'])
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name='tmax_properties')
+@pytest.mark.parametrize('case_id', TMAX_SOURCE_CASES)
+def test_Image_tmax_properties(tmax_properties, case_id):
     """Test if properties are set on the Tmax image"""
-    output = utils.getinfo(default_image_obj(tmax_source=tmax_source).tmax)
-    if expected:
-        assert output['properties']['tmax_source'] == expected['tmax_source']
-    else:
-        assert output['properties']['tmax_source'] == tmax_source
+    tmax_source = TMAX_SOURCE_CASES[case_id][0]
+    assert tmax_properties[case_id]['tmax_source'] == tmax_source
+
+
+@pytest.fixture(scope='module')
+def tmax_constant_properties():
+    return case_properties(TMAX_CONSTANT_CASES, tmax_image, ['tmax_source'])
+
+
+@pytest.mark.xdist_group(name='tmax_constant_properties')
+@pytest.mark.parametrize('case_id', TMAX_CONSTANT_CASES)
+def test_Image_tmax_properties_constant(tmax_constant_properties, case_id):
+    """Test if the custom tmax_source property is set on a constant Tmax image"""
+    assert tmax_constant_properties[case_id]['tmax_source'] == 'custom_305'
 
 
 # CGM - Test the from_landsat and from_image methods before testing the
@@ -433,14 +547,11 @@ def test_Image_from_landsat_c2_sr_scaling():
 
     # LST correction and cloud score masking do not work with a constant image
     #   and must be explicitly set to False
-    output = utils.constant_image_value(ssebop.Image.from_landsat_c2_sr(
+    m = ssebop.Image.from_landsat_c2_sr(
         input_img, c2_lst_correct=False,
-        cloudmask_args={'cloud_score_flag': False, 'filter_flag': False}).ndvi)
+        cloudmask_args={'cloud_score_flag': False, 'filter_flag': False})
+    output = utils.constant_image_value(ee.Image([m.ndvi, m.lst]))
     assert abs(output['ndvi'] - 0.333) <= 0.01
-
-    output = utils.constant_image_value(ssebop.Image.from_landsat_c2_sr(
-        input_img, c2_lst_correct=False,
-        cloudmask_args={'cloud_score_flag': False, 'filter_flag': False}).lst)
     assert abs(output['lst'] - 300) <= 0.1
 
 
@@ -472,11 +583,11 @@ def test_Image_from_landsat_c2_sr_c2_lst_correct_fill():
     image_id = 'LANDSAT/LC08/C02/T1_L2/LC08_031034_20160702'
     xy = (-102.08284, 37.81728)
     # CGM - Is the uncorrected test needed?
-    uncorrected = utils.point_image_value(
-        ssebop.Image.from_landsat_c2_sr(image_id, c2_lst_correct=False).lst, xy)
+    uncorrected, corrected = utils.point_image_values([
+        [ssebop.Image.from_landsat_c2_sr(image_id, c2_lst_correct=False).lst, xy],
+        [ssebop.Image.from_landsat_c2_sr(image_id, c2_lst_correct=True).lst, xy],
+    ])
     assert uncorrected['lst'] is None
-    corrected = utils.point_image_value(
-        ssebop.Image.from_landsat_c2_sr(image_id, c2_lst_correct=True).lst, xy)
     assert corrected['lst'] > 0
     # # Exact test values copied from openet-core
     # assert abs(corrected['lst'] - 306.83) <= 0.25
@@ -501,9 +612,9 @@ def test_Image_from_landsat_c2_sr_lst_source_values():
     # xy = (-102.08284, 37.81728)
     lst_source = 'projects/openet/assets/lst/landsat/c02'
     output_img = ssebop.Image.from_landsat_c2_sr(image_id, lst_source=lst_source).lst
-    output = utils.point_image_value(output_img, xy)
+    output = utils.point_image_value(output_img, xy, properties=['lst_source_id'])
     assert abs(output['lst'] - 322.8) <= 0.25
-    assert output_img.get('lst_source_id').getInfo().startswith(lst_source)
+    assert output['lst_source_id'].startswith(lst_source)
 
 
 def test_Image_from_landsat_c2_sr_lst_source_missing():
@@ -514,9 +625,9 @@ def test_Image_from_landsat_c2_sr_lst_source_missing():
     xy = (-102.08284, 37.81728)
     lst_source = 'projects/openet/assets/lst/landsat/c02'
     output_img = ssebop.Image.from_landsat_c2_sr(image_id, lst_source=lst_source).lst
-    output = utils.point_image_value(output_img, xy)
+    output = utils.point_image_value(output_img, xy, properties=['lst_source_id'])
     assert output['lst'] == None
-    assert output_img.get('lst_source_id').getInfo() == 'None'
+    assert output['lst_source_id'] == 'None'
 
 
 # # DEADBEEF - Keep for now in case approach changes for handling missing scenes in LST source
@@ -586,11 +697,12 @@ def test_Image_tcorr_image_nodata(lst, ndvi, tmax, expected):
     assert output['tcorr'] is None and expected is None
 
 
-def test_Image_tcorr_image_band_name():
-    output = utils.getinfo(default_image_obj().tcorr_image)
-    assert output['bands'][0]['id'] == 'tcorr'
+@pytest.mark.xdist_group(name='image_band_names')
+def test_Image_tcorr_image_band_name(band_names):
+    assert band_names['tcorr_image'] == 'tcorr'
 
 
+@pytest.mark.slow
 def test_Image_tcorr_image_properties():
     """Test if properties are set on the tcorr image"""
     tmax_source = 'projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010'
@@ -610,6 +722,7 @@ def test_Image_tcorr_stats_constant(tcorr=0.993548387, count=40564857, tol=0.000
 
 
 # NOTE: These values seem to change by small amounts for no reason
+@pytest.mark.slow
 @pytest.mark.parametrize(
     'image_id, tmax_source, expected',
     [
@@ -640,23 +753,35 @@ def test_Image_tcorr_stats_landsat(image_id, tmax_source, expected, tol=0.000001
     #         expected['tcorr_count']) <= 0.0000001
 
 
-@pytest.mark.parametrize(
-    'tcorr_src, tmax_src, image_id, xy, expected',
-    [
-        ['FANO', 'projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010',
-         'LANDSAT/LC08/C02/T1_L2/LC08_042035_20150713', SCENE_POINT, 0.9803095962281566],
-        ['FANO',
-         'projects/earthengine-legacy/assets/projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010',
-         'LANDSAT/LC08/C02/T1_L2/LC08_042035_20150713', SCENE_POINT, 0.9803095962281566],
-    ]
-)
-def test_Image_tcorr_fano_source(tcorr_src, tmax_src, image_id, xy, expected, tol=0.000001):
+TCORR_FANO_SOURCE_CASES = {
+    'daymet_v4_mean_1981_2010': [
+        'FANO', 'projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010',
+        'LANDSAT/LC08/C02/T1_L2/LC08_042035_20150713', SCENE_POINT, 0.9803095962281566],
+    'daymet_v4_mean_1981_2010_legacy': [
+        'FANO',
+        'projects/earthengine-legacy/assets/projects/usgs-ssebop/tmax/daymet_v4_mean_1981_2010',
+        'LANDSAT/LC08/C02/T1_L2/LC08_042035_20150713', SCENE_POINT, 0.9803095962281566],
+}
+
+
+def tcorr_image(tcorr_src, tmax_src, image_id):
+    return ssebop.Image.from_image_id(
+        image_id, tcorr_source=tcorr_src, tmax_source=tmax_src,
+        tmax_resample='nearest', c2_lst_correct=False).tcorr
+
+
+@pytest.fixture(scope='module')
+def tcorr_fano_source_values():
+    return point_case_values(TCORR_FANO_SOURCE_CASES, tcorr_image)
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name='tcorr_fano_source_values')
+@pytest.mark.parametrize('case_id', TCORR_FANO_SOURCE_CASES)
+def test_Image_tcorr_fano_source(tcorr_fano_source_values, case_id, tol=0.000001):
     """Test getting Tcorr value and index for a single date at a real point"""
-    tcorr_img = ssebop.Image.from_image_id(
-        image_id, tcorr_source=tcorr_src, tmax_source=tmax_src, tmax_resample='nearest',
-        c2_lst_correct=False).tcorr
-    tcorr = utils.point_image_value(tcorr_img, xy)
-    assert abs(tcorr['tcorr'] - expected) <= tol
+    expected = TCORR_FANO_SOURCE_CASES[case_id][-1]
+    assert abs(tcorr_fano_source_values[case_id]['tcorr'] - expected) <= tol
 
 
 @pytest.mark.parametrize(
@@ -33,27 +33,75 @@ def getinfo(ee_obj, n=4):
     return output
 
 
+def getinfo_raise(ee_obj, n=4):
+    """Make an exponential back off getInfo call that raises the last exception
+
+    Unlike getinfo(), an EEException from the final attempt is raised instead of
+    returning None, so the original error is not lost for batched requests.
+    """
+    for i in range(1, n):
+        try:
+            return ee_obj.getInfo()
+        except ee.ee_exception.EEException as e:
+            if i == n - 1:
+                raise e
+            logging.info(f'    Resending query ({i}/{n})')
+            logging.info(f'    {e}')
+            sleep(i ** 3)
+
+
 # TODO: Import from openet.core.utils instead of defining here
 # Should these be test fixtures instead?
 # I'm not sure how to make them fixtures and allow input parameters
 def constant_image_value(image, crs='EPSG:32613', scale=1):
     """Extract the output value from a calculation done with constant images"""
+    # A point geometry is used since only a single pixel needs to be reduced
     rr_params = {
         'reducer': ee.Reducer.first(),
-        'geometry': ee.Geometry.Rectangle([0, 0, 10, 10], crs, False),
+        'geometry': ee.Geometry.Point([0, 0], crs),
+        'crs': crs,
         'scale': scale,
     }
     return getinfo(ee.Image(image).reduceRegion(**rr_params))
 
 
-def point_image_value(image, xy, scale=1):
-    """Extract the output value from a calculation at a point"""
+def constant_image_values(images, crs='EPSG:32613', scale=1):
+    """Extract the output values for a list of constant images in a single call"""
+    rr_params = {
+        'reducer': ee.Reducer.first(),
+        'geometry': ee.Geometry.Point([0, 0], crs),
+        'crs': crs,
+        'scale': scale,
+    }
+    return getinfo_raise(ee.List([
+        ee.Image(image).reduceRegion(**rr_params) for image in images
+    ]))
+
+
+def point_image_value(image, xy, scale=1, properties=None):
+    """Extract the output value from a calculation at a point
+
+    Any image properties in the properties list are included in the output
+    """
     rr_params = {
         'reducer': ee.Reducer.first(),
         'geometry': ee.Geometry.Point(xy),
         'scale': scale,
     }
-    return getinfo(ee.Image(image).reduceRegion(**rr_params))
+    output = ee.Image(image).reduceRegion(**rr_params)
+    if properties:
+        output = output.combine(ee.Image(image).toDictionary(properties))
+    return getinfo(output)
+
+
+def point_image_values(image_xy_list, scale=1):
+    """Extract the output values for a list of image/point pairs in a single call"""
+    return getinfo_raise(ee.List([
+        ee.Image(image).reduceRegion(
+            reducer=ee.Reducer.first(), geometry=ee.Geometry.Point(xy), scale=scale
+        )
+        for image, xy in image_xy_list
+    ]))
 
 
 def point_coll_value(coll, xy, scale=1):